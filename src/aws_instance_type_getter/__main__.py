@@ -1,23 +1,98 @@
 """Main program."""
 from __future__ import annotations
 
-from boto3.session import Session
-from openpyxl import Workbook
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .args import parse_command_args
-from .availability_zone import get_zones
-from .instance_type import get_instance_types
-from .region import get_regions
-
-args = parse_command_args()
-if args.profile:
-    session = Session(profile_name=args.profile)
-else:
-    session = Session()
-
-workbook = Workbook()
-
-regions = get_regions(session)
-for region in regions:
-    zones = get_zones(session, region.name)
-    instance_types = get_instance_types(session, region.name)
+
+_MAX_WORKERS = 32
+
+
+def main() -> None:
+    """Get instance types of all regions and write them to a workbook."""
+    args = parse_command_args()
+
+    # boto3 and openpyxl are slow to import, so skip them for --help and
+    # argument errors.
+    # pylint: disable=import-outside-toplevel
+    from boto3.session import Session
+    from openpyxl import Workbook
+
+    from .availability_zone import get_zones
+    from .client import get_ec2_client
+    from .instance_type import (
+        INSTANCE_TYPE_COLUMNS,
+        CellValue,
+        catalog_region,
+        get_instance_types,
+        instance_type_rows,
+    )
+    from .region import get_regions
+
+    if args.profile:
+        session = Session(profile_name=args.profile)
+    else:
+        session = Session()
+
+    workbook = Workbook(write_only=True)
+    region_sheet = workbook.create_sheet("Regions")
+    region_sheet.append(("Name", "Location", "Display name"))
+    zone_sheet = workbook.create_sheet("AvailabilityZones")
+    zone_sheet.append(("Region", "Name", "Zone ID", "Zone type"))
+    instance_type_sheet = workbook.create_sheet("InstanceTypes")
+    instance_type_sheet.append(
+        ("Region", *(header for header, _ in INSTANCE_TYPE_COLUMNS))
+    )
+
+    def collect_zones(region_name: str) -> list[tuple[CellValue, ...]]:
+        """Get availability zone rows of the region."""
+        return [
+            (region_name, zone.name, zone.zone_id, zone.zone_type.value)
+            for zone in get_zones(get_ec2_client(session, region_name))
+        ]
+
+    def collect_instance_types(
+        region_name: str,
+    ) -> list[tuple[CellValue, ...]]:
+        """Get instance type rows of the region."""
+        ec2 = get_ec2_client(session, region_name)
+        catalog_ec2 = get_ec2_client(
+            session, catalog_region(ec2.meta.partition, region_name)
+        )
+        instance_types = get_instance_types(
+            ec2,
+            catalog_ec2,
+            args.current_only,
+            args.architectures,
+        )
+        return [
+            (region_name, *row) for row in instance_type_rows(instance_types)
+        ]
+
+    regions = get_regions(session)
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(_MAX_WORKERS, len(regions)))
+    ) as executor:
+        pending = {}
+        for region in regions:
+            region_sheet.append(
+                (region.name, region.location, region.display_name)
+            )
+            zones = executor.submit(collect_zones, region.name)
+            instance_types = executor.submit(
+                collect_instance_types, region.name
+            )
+            pending[zones] = zone_sheet
+            pending[instance_types] = instance_type_sheet
+        # Write each region as soon as it arrives, and drop the future so
+        # that its rows can be freed.
+        for future in as_completed(pending):
+            sheet = pending.pop(future)
+            for row in future.result():
+                sheet.append(row)
+
+    workbook.save(args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,35 @@
 """Argument parser."""
-from __future__ import __annotations__
+from __future__ import annotations
 
 from argparse import ArgumentParser
 
+from .instance_type import CpuArchitectures
+
 
 class _CommandArgument:
     """Command arguments."""
 
-    def __init__(self, profile: str | None, output: str) -> None:
+    __slots__ = ("profile", "output", "current_only", "architectures")
+
+    def __init__(
+        self,
+        profile: str | None,
+        output: str,
+        current_only: bool,
+        architectures: tuple[str, ...],
+    ) -> None:
         """Initialize data.
 
         Args:
             profile(str): AWS profile name
             output(str): Output filename
+            current_only(bool): Only current generation instance types
+            architectures(tuple): Architectures to filter instance types
         """
         self.profile = profile
         self.output = output
+        self.current_only = current_only
+        self.architectures = architectures
 
 
 def parse_command_args() -> _CommandArgument:
@@ -29,7 +43,24 @@ def parse_command_args() -> _CommandArgument:
     parser.add_argument(
         "-o", "--output", help="Output filename", default="out.xlsx"
     )
+    parser.add_argument(
+        "--current-only",
+        action="store_true",
+        help="Only current generation instance types",
+    )
+    parser.add_argument(
+        "--arch",
+        action="append",
+        choices=[a.value for a in CpuArchitectures],
+        default=[],
+        dest="architectures",
+        help="Supported architecture of instance types. Can be repeated",
+    )
     args = parser.parse_args()
     profile: str | None = args.profile
     output: str = args.output
-    return _CommandArgument(profile, output)
+    current_only: bool = args.current_only
+    architectures: list[str] = args.architectures
+    return _CommandArgument(
+        profile, output, current_only, tuple(dict.fromkeys(architectures))
+    )
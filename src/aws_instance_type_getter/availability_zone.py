@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 from enum import Enum
+from typing import TYPE_CHECKING
 
-from boto3.session import Session
+if TYPE_CHECKING:
+    from mypy_boto3_ec2.client import EC2Client
 
 
 class ZoneType(str, Enum):
@@ -14,9 +16,14 @@ class ZoneType(str, Enum):
     WAVELENGTH = "wavelength-zone"
 
 
+_ZONE_TYPES = {t.value: t for t in ZoneType}
+
+
 class AvailabilityZone:
     """Availability zone."""
 
+    __slots__ = ("name", "zone_id", "zone_type")
+
     def __init__(
         self: AvailabilityZone, name: str, zone_id: str, zone_type: ZoneType
     ) -> None:
@@ -32,17 +39,15 @@ class AvailabilityZone:
         self.zone_type = zone_type
 
 
-def get_zones(session: Session, region_name: str) -> list[AvailabilityZone]:
+def get_zones(ec2: EC2Client) -> list[AvailabilityZone]:
     """Get availability zones.
 
     Args:
-        session(Session): Boto3 session
-        region_name(str): Region name
+        ec2(EC2Client): EC2 client of the region
 
     Returns:
         list: Availability zones
     """
-    ec2 = session.client("ec2", region_name=region_name)
     azs_res = ec2.describe_availability_zones(
         Filters=[
             {
@@ -53,7 +58,9 @@ def get_zones(session: Session, region_name: str) -> list[AvailabilityZone]:
     )
     return [
         AvailabilityZone(
-            az["ZoneName"], az["ZoneId"], ZoneType(az["ZoneType"])
+            az["ZoneName"],
+            az["ZoneId"],
+            _ZONE_TYPES.get(az["ZoneType"]) or ZoneType(az["ZoneType"]),
         )
         for az in azs_res["AvailabilityZones"]
     ]
@@ -0,0 +1,39 @@
+"""AWS client settings."""
+from __future__ import annotations
+
+from functools import lru_cache
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from boto3.session import Session
+from botocore.config import Config
+
+if TYPE_CHECKING:
+    from mypy_boto3_ec2.client import EC2Client
+
+CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 10},
+    max_pool_connections=64,
+)
+
+_client_lock = Lock()
+
+
+@lru_cache(maxsize=None)
+def get_ec2_client(session: Session, region_name: str) -> EC2Client:
+    """Get EC2 client of the region.
+
+    Clients are cached per session and region. Creating a client from a
+    session is not thread safe, so it is serialized.
+
+    Args:
+        session(Session): Boto3 session
+        region_name(str): Region name
+
+    Returns:
+        EC2Client: EC2 client
+    """
+    with _client_lock:
+        return session.client(
+            "ec2", region_name=region_name, config=CLIENT_CONFIG
+        )
@@ -2,13 +2,40 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Callable, Iterable, Iterator
 from enum import Enum
-from typing import TYPE_CHECKING
-
-from boto3.session import Session
+from operator import attrgetter
+from queue import Full, Queue
+from threading import Event, Lock, Thread
+from time import monotonic
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from mypy_boto3_ec2.type_defs import InstanceTypeInfoTypeDef
+    from mypy_boto3_ec2.client import EC2Client
+    from mypy_boto3_ec2.type_defs import (
+        FilterTypeDef,
+        InstanceTypeInfoTypeDef,
+    )
+
+    _Page = list[InstanceTypeInfoTypeDef]
+
+_PREFETCH_PAGES = 4
+_PREFETCH_PUT_TIMEOUT = 0.5
+_DESCRIBE_BATCH_SIZE = 100
+_DESCRIBE_PAGE_SIZE = 100
+_OFFERINGS_PAGE_SIZE = 1000
+_CATALOG_TTL = 15 * 60.0
+# Regions offering the broadest set of instance types in each partition
+_CATALOG_REGIONS = {
+    "aws": "us-east-1",
+    "aws-cn": "cn-north-1",
+    "aws-us-gov": "us-gov-west-1",
+}
+_EMPTY: MappingProxyType[str, Any] = MappingProxyType({})
+_NET_PERFORMANCE_RE = re.compile(
+    r"(?:Up to (\d+(?:\.\d+)?)|(?:(\d+)x )?(\d+(?:\.\d+)?)) Gigabit"
+)
 
 
 class CpuArchitectures(str, Enum):
@@ -21,6 +48,9 @@ class CpuArchitectures(str, Enum):
     X64_MAC = "x86_64_mac"
 
 
+_CPU_ARCHITECTURES = {e.value: e for e in CpuArchitectures}
+
+
 class NvmeSupportStatus(str, Enum):
     """NVMe support status."""
 
@@ -29,6 +59,9 @@ class NvmeSupportStatus(str, Enum):
     NOT_SUPPORTED = "unsupported"
 
 
+_NVME_SUPPORT_STATUSES = {e.value: e for e in NvmeSupportStatus}
+
+
 class InstanceStorageType(str, Enum):
     """Instance storage type."""
 
@@ -36,6 +69,9 @@ class InstanceStorageType(str, Enum):
     HDD = "hdd"
 
 
+_INSTANCE_STORAGE_TYPES = {e.value: e for e in InstanceStorageType}
+
+
 class EbsOptimizeSupportStatus(str, Enum):
     """EBS optimize support status."""
 
@@ -44,9 +80,14 @@ class EbsOptimizeSupportStatus(str, Enum):
     NOT_SUPPORTED = "unsupported"
 
 
+_EBS_OPTIMIZE_SUPPORT_STATUSES = {e.value: e for e in EbsOptimizeSupportStatus}
+
+
 class _InstanceStorageInfo:
     """Instance storage information."""
 
+    __slots__ = ("size", "count", "storage_type")
+
     def __init__(
         self: _InstanceStorageInfo,
         size: int,
@@ -86,9 +127,24 @@ class InstanceNetworkFuzzySpeed(str, Enum):
     INVALID = "Invalid"
 
 
+_FUZZY_SPEEDS: dict[str, InstanceNetworkFuzzySpeed] = {
+    speed.value: speed
+    for speed in InstanceNetworkFuzzySpeed
+    if speed != InstanceNetworkFuzzySpeed.INVALID
+}
+
+
 class _InstanceNetworkPerformance:
     """Instance network performance."""
 
+    __slots__ = (
+        "_spec",
+        "_performance_type",
+        "_performance_fuzzy_value",
+        "_speed",
+        "_aggregation",
+    )
+
     def __init__(self: _InstanceNetworkPerformance, spec: str) -> None:
         """Parse and initialize.
 
@@ -96,59 +152,34 @@ class _InstanceNetworkPerformance:
             spec(str): Speed spec
         """
         self._spec = spec
-        if spec == "Very Low":
+        fuzzy_value = _FUZZY_SPEEDS.get(spec)
+        if fuzzy_value is not None:
             self._performance_type = InstanceNetworkPerformanceType.FUZZY
-            self._performance_fuzzy_value = InstanceNetworkFuzzySpeed.VERY_LOW
-            self._speed = 0.0
-            self._aggregation = 1
-        elif spec == "Low":
-            self._performance_type = InstanceNetworkPerformanceType.FUZZY
-            self._performance_fuzzy_value = InstanceNetworkFuzzySpeed.LOW
-            self._speed = 0.0
-            self._aggregation = 1
-        elif spec == "Low to Moderate":
-            self._performance_type = InstanceNetworkPerformanceType.FUZZY
-            self._performance_fuzzy_value = (
-                InstanceNetworkFuzzySpeed.LOW_TO_MODERATE
-            )
-            self._speed = 0.0
-            self._aggregation = 1
-        elif spec == "Moderate":
-            self._performance_type = InstanceNetworkPerformanceType.FUZZY
-            self._performance_fuzzy_value = InstanceNetworkFuzzySpeed.MODERATE
-            self._speed = 0.0
-            self._aggregation = 1
-        elif spec == "High":
-            self._performance_type = InstanceNetworkPerformanceType.FUZZY
-            self._performance_fuzzy_value = InstanceNetworkFuzzySpeed.HIGH
+            self._performance_fuzzy_value = fuzzy_value
             self._speed = 0.0
             self._aggregation = 1
         else:
             self._performance_fuzzy_value = InstanceNetworkFuzzySpeed.INVALID
-            up_to_md = re.match(r"^Up to (\d+(\.\d+)?) Gigabit", spec)
-            if up_to_md:
+            net_md = _NET_PERFORMANCE_RE.match(spec)
+            if net_md is None:
+                self._performance_type = InstanceNetworkPerformanceType.UNKNOWN
+                self._speed = 0.0
+                self._aggregation = 1
+            elif net_md[1]:
                 self._performance_type = InstanceNetworkPerformanceType.UPBOUND
-                self._speed = float(up_to_md[1])
+                self._speed = float(net_md[1])
                 self._aggregation = 1
             else:
-                rest_md = re.match(r"((\d+)x )?(\d+(\.\d+)?) Gigabit", spec)
-                if rest_md:
-                    self._speed = float(rest_md[3])
-                    if rest_md[2]:
-                        self._performance_type = (
-                            InstanceNetworkPerformanceType.MULTIPLE
-                        )
-                        self._aggregation = int(rest_md[2])
-                    else:
-                        self._performance_type = (
-                            InstanceNetworkPerformanceType.SINGLE
-                        )
-                        self._aggregation = 1
+                self._speed = float(net_md[3])
+                if net_md[2]:
+                    self._performance_type = (
+                        InstanceNetworkPerformanceType.MULTIPLE
+                    )
+                    self._aggregation = int(net_md[2])
                 else:
                     self._performance_type = (
-                        InstanceNetworkPerformanceType.UNKNOWN
+                        InstanceNetworkPerformanceType.SINGLE
                     )
-                    self._speed = 0.0
                     self._aggregation = 1
 
     @property
@@ -213,6 +244,8 @@ class _InstanceNetworkPerformance:
 class _NetworkCard:
     """Network card."""
 
+    __slots__ = ("index", "performance", "max_interfaces")
+
     def __init__(
         self: _NetworkCard,
         index: int,
@@ -233,9 +266,14 @@ class EnaSupport(str, Enum):
     NOT_SUPPORTED = "unsupported"
 
 
+_ENA_SUPPORTS = {e.value: e for e in EnaSupport}
+
+
 class _GraphicBoard:
     """Graphic board."""
 
+    __slots__ = ("name", "manufacturer", "count", "memory")
+
     def __init__(
         self: _GraphicBoard,
         name: str,
@@ -253,6 +291,8 @@ class _GraphicBoard:
 class _FpgaBoard:
     """FPGA board."""
 
+    __slots__ = ("name", "manufacturer", "count", "memory")
+
     def __init__(
         self: _FpgaBoard,
         name: str,
@@ -270,6 +310,8 @@ class _FpgaBoard:
 class _InterfaceAccelerator:
     """Interface accelarator."""
 
+    __slots__ = ("name", "manufacturer", "count")
+
     def __init__(
         self: _InterfaceAccelerator, name: str, manufacturer: str, count: int
     ) -> None:
@@ -287,63 +329,130 @@ class PlacementStrategy(str, Enum):
     SPREAD = "spread"
 
 
+_PLACEMENT_STRATEGIES = {e.value: e for e in PlacementStrategy}
+
+
 class InstanceType:
     """Instance type data."""
 
+    __slots__ = (
+        "name",
+        "is_current",
+        "supports_on_demand",
+        "supports_spot",
+        "supports_ebs_root",
+        "supports_instance_store_root",
+        "support_cpus",
+        "cpu_speed",
+        "supports_sev_snp",
+        "default_vcpus",
+        "default_cores",
+        "default_threads_per_core",
+        "memory_size",
+        "has_instance_store",
+        "total_instance_store_size",
+        "_instance_store_disks",
+        "instance_store_nvme_support",
+        "instance_store_encryption",
+        "support_ebs_optimize",
+        "support_ebs_encrypt",
+        "support_ebs_nvme",
+        "ebs_optimize_base_band",
+        "ebs_optimize_base_throughput",
+        "ebs_optimize_base_iops",
+        "ebs_optimize_max_band",
+        "ebs_optimize_max_throughput",
+        "ebs_optimize_max_iops",
+        "net_performance",
+        "max_net_interface",
+        "max_net_cards",
+        "default_card_index",
+        "_net_cards",
+        "support_ipv6",
+        "ipv4_addr_per_interface",
+        "ipv6_addr_per_interface",
+        "ena_support",
+        "efa_supported",
+        "max_efa_interfaces",
+        "gpu_support",
+        "_gpus",
+        "total_gpu_memory",
+        "fpga_support",
+        "_fpgas",
+        "total_fpga_memory",
+        "interface_accelerator_support",
+        "_interface_accelerators",
+        "placement_strategies",
+        "support_hibernation",
+        "burstable",
+        "_raw",
+    )
+
     def __init__(self: InstanceType, data: "InstanceTypeInfoTypeDef") -> None:
-        """."""
-        self.name = data.get("InstanceType", "t1.micro")
+        """Initialize data.
+
+        Nested lists, such as GPUs and network cards, are parsed from the
+        raw data on first access.
+
+        Args:
+            data(InstanceTypeInfoTypeDef): DescribeInstanceTypes item
+        """
+        self._raw = data
+        self._instance_store_disks: list[_InstanceStorageInfo] | None = None
+        self._net_cards: list[_NetworkCard] | None = None
+        self._gpus: list[_GraphicBoard] | None = None
+        self._fpgas: list[_FpgaBoard] | None = None
+        self._interface_accelerators: list[_InterfaceAccelerator] | None = None
+        self.name: str = data.get("InstanceType", "t1.micro")
         self.is_current = data.get("CurrentGeneration", True)
-        usage_classes = data.get("SupportedUsageClasses", [])
+        usage_classes = data.get("SupportedUsageClasses", ())
         self.supports_on_demand = "on-demand" in usage_classes
         self.supports_spot = "spot" in usage_classes
-        root_devices = data.get("SupportedRootDeviceTypes", [])
+        root_devices = data.get("SupportedRootDeviceTypes", ())
         self.supports_ebs_root = "ebs" in root_devices
         self.supports_instance_store_root = "instance-store" in root_devices
+        proc_info = data.get("ProcessorInfo") or _EMPTY
         self.support_cpus = [
-            CpuArchitectures(arch)
-            for arch in data.get("ProcessorInfo", {}).get(
-                "SupportedArchitectures", []
-            )
+            _CPU_ARCHITECTURES.get(arch) or CpuArchitectures(arch)
+            for arch in proc_info.get("SupportedArchitectures", ())
         ]
-        self.cpu_speed = data.get("ProcessorInfo", {}).get(
-            "SustainedClockSpeedInGhz", 0.0
+        self.cpu_speed = proc_info.get("SustainedClockSpeedInGhz", 0.0)
+        self.supports_sev_snp = "amd-sev-snp" in proc_info.get(
+            "SupportedFeatures", ()
         )
-        self.supports_sev_snp = "amd-sev-snp" in data.get(
-            "ProcessorInfo", {}
-        ).get("SupportedFeatures", [])
-        self.default_vcpus = data.get("VCpuInfo", {}).get("DefaultVCpus", 1)
-        self.default_cores = data.get("VCpuInfo", {}).get("DefaultCores", 1)
-        self.default_threads_per_core = data.get("VCpuInfo", {}).get(
+        vcpu_info = data.get("VCpuInfo") or _EMPTY
+        self.default_vcpus = vcpu_info.get("DefaultVCpus", 1)
+        self.default_cores = vcpu_info.get("DefaultCores", 1)
+        self.default_threads_per_core = vcpu_info.get(
             "DefaultThreadsPerCore", 1
         )
-        self.memory_size = data.get("MemoryInfo", {}).get("SizeInMiB", 0)
+        self.memory_size = (data.get("MemoryInfo") or _EMPTY).get(
+            "SizeInMiB", 0
+        )
         self.has_instance_store = data.get("InstanceStorageSupported", False)
         if self.has_instance_store:
-            instance_store_info = data.get("InstanceStorageInfo", {})
+            instance_store_info = data.get("InstanceStorageInfo") or _EMPTY
             self.total_instance_store_size = instance_store_info.get(
                 "TotalSizeInGB", 0
             )
-            self.instance_store_disks = [
-                _InstanceStorageInfo(
-                    d.get("SizeInGB", 0),
-                    d.get("Count", 1),
-                    InstanceStorageType(d.get("Type", "ssd")),
-                )
-                for d in instance_store_info.get("Disks", [])
-            ]
+            nvme_support = instance_store_info.get(
+                "NvmeSupport", "unsupported"
+            )
+            self.instance_store_nvme_support = _NVME_SUPPORT_STATUSES.get(
+                nvme_support
+            ) or NvmeSupportStatus(nvme_support)
             self.instance_store_encryption = (
                 instance_store_info.get("EncryptionSupport") == "required"
             )
         else:
             self.total_instance_store_size = 0
-            self.instance_store_disks = []
             self.instance_store_nvme_support = NvmeSupportStatus.NOT_SUPPORTED
             self.instance_store_encryption = False
-        ebs_status = data.get("EbsInfo", {})
-        self.support_ebs_optimize = EbsOptimizeSupportStatus(
-            ebs_status.get("EbsOptimizedSupport", "unsupported")
-        )
+        ebs_status = data.get("EbsInfo") or _EMPTY
+        ebs_optimize = ebs_status.get("EbsOptimizedSupport", "unsupported")
+        self.support_ebs_optimize = _EBS_OPTIMIZE_SUPPORT_STATUSES.get(
+            ebs_optimize
+        ) or EbsOptimizeSupportStatus(ebs_optimize)
         self.support_ebs_encrypt = (
             ebs_status.get("EncryptionSupport", "unsupported") == "supported"
         )
@@ -351,7 +460,7 @@ class InstanceType:
             ebs_status.get("NvmeSupport", "supported") == "supported"
         )
         if self.support_ebs_optimize != EbsOptimizeSupportStatus.NOT_SUPPORTED:
-            opt_info = ebs_status.get("EbsOptimizedInfo", {})
+            opt_info = ebs_status.get("EbsOptimizedInfo") or _EMPTY
             self.ebs_optimize_base_band = opt_info.get(
                 "BaselineBandwidthInMbps", 0
             )
@@ -373,7 +482,7 @@ class InstanceType:
             self.ebs_optimize_max_band = 0
             self.ebs_optimize_max_throughput = 0.0
             self.ebs_optimize_max_iops = 0
-        net_info = data.get("NetworkInfo", {})
+        net_info = data.get("NetworkInfo") or _EMPTY
         net_perf_v = net_info.get("NetworkPerformance")
         if net_perf_v:
             self.net_performance: _InstanceNetworkPerformance | None = (
@@ -384,96 +493,544 @@ class InstanceType:
         self.max_net_interface = net_info.get("MaximumNetworkInterfaces", 1)
         self.max_net_cards = net_info.get("MaximumNetworkCards", 1)
         self.default_card_index = net_info.get("DefaultNetworkCardIndex", 0)
-        self.net_cards = [
-            _NetworkCard(
-                c.get("NetworkCardIndex", i),
-                _InstanceNetworkPerformance(c.get("NetworkPerformance", "")),
-                c.get("MaximumNetworkInterfaces", 1),
-            )
-            for i, c in enumerate(net_info.get("NetworkCards", []))
-        ]
         self.support_ipv6 = net_info.get("Ipv6Supported", False)
         self.ipv4_addr_per_interface = net_info.get(
             "Ipv4AddressesPerInterface", 1
         )
-        self.ipv6_addr_per_interface = net_info.get(
-            "Ipv6AddressesPerInterface", 1 if self.support_ipv6 else 0
+        ipv6_addrs = net_info.get("Ipv6AddressesPerInterface")
+        self.ipv6_addr_per_interface = (
+            ipv6_addrs
+            if ipv6_addrs is not None
+            else (1 if self.support_ipv6 else 0)
         )
-        self.ena_support = EnaSupport(
-            net_info.get("EnaSupport", "unsupported")
+        ena_support = net_info.get("EnaSupport", "unsupported")
+        self.ena_support = _ENA_SUPPORTS.get(ena_support) or EnaSupport(
+            ena_support
         )
         self.efa_supported = net_info.get("EfaSupported", False)
-        self.max_efa_interfaces = net_info.get("EfaInfo", {}).get(
-            "MaximumEfaInterfaces", 1 if self.efa_supported else 0
+        max_efa_interfaces = (net_info.get("EfaInfo") or _EMPTY).get(
+            "MaximumEfaInterfaces"
+        )
+        self.max_efa_interfaces = (
+            max_efa_interfaces
+            if max_efa_interfaces is not None
+            else (1 if self.efa_supported else 0)
         )
-        if "GpuInfo" in data:
+        gpu_info = data.get("GpuInfo")
+        if gpu_info is not None:
             self.gpu_support = True
-            self.gpus = [
+            self.total_gpu_memory = gpu_info.get("TotalGpuMemoryInMiB", 0)
+        else:
+            self.gpu_support = False
+            self.total_gpu_memory = 0
+        fpga_info = data.get("FpgaInfo")
+        if fpga_info is not None:
+            self.fpga_support = True
+            self.total_fpga_memory = fpga_info.get("TotalFpgaMemoryInMiB", 0)
+        else:
+            self.fpga_support = False
+            self.total_fpga_memory = 0
+        self.interface_accelerator_support = "InferenceAcceleratorInfo" in data
+        self.placement_strategies = [
+            _PLACEMENT_STRATEGIES.get(pn) or PlacementStrategy(pn)
+            for pn in (data.get("PlacementGroupInfo") or _EMPTY).get(
+                "SupportedStrategies", ()
+            )
+        ]
+        self.support_hibernation = data.get("HibernationSupported", False)
+        self.burstable = data.get("BurstablePerformanceSupported", False)
+
+    @property
+    def instance_store_disks(
+        self: InstanceType,
+    ) -> list[_InstanceStorageInfo]:
+        """Instance store disks.
+
+        Returns:
+            list: Instance store disks
+        """
+        if self._instance_store_disks is None:
+            store_info = self._raw.get("InstanceStorageInfo") or _EMPTY
+            self._instance_store_disks = [
+                _InstanceStorageInfo(
+                    d.get("SizeInGB", 0),
+                    d.get("Count", 1),
+                    _INSTANCE_STORAGE_TYPES.get(d.get("Type", "ssd"))
+                    or InstanceStorageType(d.get("Type", "ssd")),
+                )
+                for d in store_info.get("Disks", ())
+            ]
+        return self._instance_store_disks
+
+    @property
+    def net_cards(self: InstanceType) -> list[_NetworkCard]:
+        """Network cards.
+
+        Returns:
+            list: Network cards
+        """
+        if self._net_cards is None:
+            net_info = self._raw.get("NetworkInfo") or _EMPTY
+            self._net_cards = [
+                _NetworkCard(
+                    c.get("NetworkCardIndex", i),
+                    _InstanceNetworkPerformance(
+                        c.get("NetworkPerformance", "")
+                    ),
+                    c.get("MaximumNetworkInterfaces", 1),
+                )
+                for i, c in enumerate(net_info.get("NetworkCards", ()))
+            ]
+        return self._net_cards
+
+    @property
+    def gpus(self: InstanceType) -> list[_GraphicBoard]:
+        """GPUs.
+
+        Returns:
+            list: GPUs
+        """
+        if self._gpus is None:
+            gpu_info = self._raw.get("GpuInfo") or _EMPTY
+            self._gpus = [
                 _GraphicBoard(
                     g.get("Name", ""),
                     g.get("Manufacturer", ""),
                     g.get("Count", 1),
-                    g.get("MemoryInfo", {}).get("SizeInMiB", 0),
+                    (g.get("MemoryInfo") or _EMPTY).get("SizeInMiB", 0),
                 )
-                for g in data.get("GpuInfo", {}).get("Gpus", [])
+                for g in gpu_info.get("Gpus", ())
             ]
-            self.total_gpu_memory = data.get("GpuInfo", {}).get(
-                "TotalGpuMemoryInMiB", 0
-            )
-        else:
-            self.gpu_support = False
-            self.gpus = []
-            self.total_gpu_memory = 0
-        if "FpgaInfo" in data:
-            self.fpga_support = True
-            self.fpgas = [
+        return self._gpus
+
+    @property
+    def fpgas(self: InstanceType) -> list[_FpgaBoard]:
+        """FPGAs.
+
+        Returns:
+            list: FPGAs
+        """
+        if self._fpgas is None:
+            fpga_info = self._raw.get("FpgaInfo") or _EMPTY
+            self._fpgas = [
                 _FpgaBoard(
                     b.get("Name", ""),
                     b.get("Manufacturer", ""),
                     b.get("Count", 1),
-                    b.get("MemoryInfo", {}).get("SizeInMiB", 0),
+                    (b.get("MemoryInfo") or _EMPTY).get("SizeInMiB", 0),
                 )
-                for b in data.get("FpgaInfo", {}).get("Fpgas", [])
+                for b in fpga_info.get("Fpgas", ())
             ]
-            self.total_fpga_memory = data.get("FpgaInfo", {}).get(
-                "TotalFpgaMemoryInMiB", 0
+        return self._fpgas
+
+    @property
+    def interface_accelerators(
+        self: InstanceType,
+    ) -> list[_InterfaceAccelerator]:
+        """Inference accelerators.
+
+        Returns:
+            list: Inference accelerators
+        """
+        if self._interface_accelerators is None:
+            accelerator_info = (
+                self._raw.get("InferenceAcceleratorInfo") or _EMPTY
             )
-        else:
-            self.fpga_support = False
-            self.fpgas = []
-            self.total_fpga_memory = 0
-        if "InferenceAcceleratorInfo" in data:
-            self.interface_accelerator_support = True
-            self.interface_accelerators = [
+            self._interface_accelerators = [
                 _InterfaceAccelerator(
                     ia.get("Name", ""),
                     ia.get("Manufacturer", ""),
                     ia.get("Count", 1),
                 )
-                for ia in data.get("InferenceAcceleratorInfo", {}).get(
-                    "Accelerators", []
-                )
+                for ia in accelerator_info.get("Accelerators", ())
             ]
-        else:
-            self.interface_accelerator_support = False
-        self.placement_strategies = [
-            PlacementStrategy(pn)
-            for pn in data.get("PlacementGroupInfo", {}).get(
-                "SupportedStrategies", []
+        return self._interface_accelerators
+
+
+def _join_values(values: Iterable[Enum]) -> str:
+    """Join enum values.
+
+    Args:
+        values(Iterable): Enum members
+
+    Returns:
+        str: Comma separated values
+    """
+    return ", ".join(v.value for v in values)
+
+
+def _net_performance(instance_type: InstanceType) -> str:
+    """Get network performance spec.
+
+    Args:
+        instance_type(InstanceType): Instance type
+
+    Returns:
+        str: Network performance spec. Empty if not available
+    """
+    if instance_type.net_performance is None:
+        return ""
+    return str(instance_type.net_performance)
+
+
+def _gpus(instance_type: InstanceType) -> str:
+    """Get GPUs summary.
+
+    Args:
+        instance_type(InstanceType): Instance type
+
+    Returns:
+        str: Comma separated GPUs, such as "1x NVIDIA T4"
+    """
+    return ", ".join(
+        f"{g.count}x {g.manufacturer} {g.name}" for g in instance_type.gpus
+    )
+
+
+CellValue = str | int | float | bool
+
+INSTANCE_TYPE_COLUMNS: tuple[
+    tuple[str, Callable[[InstanceType], CellValue]], ...
+] = (
+    ("Name", attrgetter("name")),
+    ("Current generation", attrgetter("is_current")),
+    ("On-demand", attrgetter("supports_on_demand")),
+    ("Spot", attrgetter("supports_spot")),
+    ("Architectures", lambda t: _join_values(t.support_cpus)),
+    ("Clock speed (GHz)", attrgetter("cpu_speed")),
+    ("vCPUs", attrgetter("default_vcpus")),
+    ("Cores", attrgetter("default_cores")),
+    ("Threads per core", attrgetter("default_threads_per_core")),
+    ("Memory (MiB)", attrgetter("memory_size")),
+    ("Instance store (GB)", attrgetter("total_instance_store_size")),
+    ("EBS optimized", lambda t: t.support_ebs_optimize.value),
+    ("EBS baseline bandwidth (Mbps)", attrgetter("ebs_optimize_base_band")),
+    ("EBS baseline IOPS", attrgetter("ebs_optimize_base_iops")),
+    ("EBS maximum bandwidth (Mbps)", attrgetter("ebs_optimize_max_band")),
+    ("EBS maximum IOPS", attrgetter("ebs_optimize_max_iops")),
+    ("Network performance", _net_performance),
+    ("Network interfaces", attrgetter("max_net_interface")),
+    ("IPv6", attrgetter("support_ipv6")),
+    ("ENA", lambda t: t.ena_support.value),
+    ("EFA", attrgetter("efa_supported")),
+    ("GPUs", _gpus),
+    ("GPU memory (MiB)", attrgetter("total_gpu_memory")),
+    ("FPGA memory (MiB)", attrgetter("total_fpga_memory")),
+    ("Placement strategies", lambda t: _join_values(t.placement_strategies)),
+    ("Hibernation", attrgetter("support_hibernation")),
+    ("Burstable", attrgetter("burstable")),
+)
+
+
+def instance_type_rows(
+    instance_types: Iterable[InstanceType],
+) -> Iterator[tuple[CellValue, ...]]:
+    """Flatten instance types into rows of INSTANCE_TYPE_COLUMNS.
+
+    Args:
+        instance_types(Iterable): Instance types
+
+    Yields:
+        tuple: Cell values of an instance type
+    """
+    getters = [getter for _, getter in INSTANCE_TYPE_COLUMNS]
+    for instance_type in instance_types:
+        yield tuple(getter(instance_type) for getter in getters)
+
+
+def _put_unless_stopped(
+    queue: Queue[_Page | Exception | None],
+    item: _Page | Exception | None,
+    stop: Event,
+) -> bool:
+    """Put an item into the queue, giving up once stop is set.
+
+    Args:
+        queue(Queue): Destination queue
+        item(_Page | Exception | None): Item to put
+        stop(Event): Set by the consumer when it no longer reads the queue
+
+    Returns:
+        bool: True if the item was put
+    """
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=_PREFETCH_PUT_TIMEOUT)
+        except Full:
+            continue
+        return True
+    return False
+
+
+def _prefetch_pages(
+    pages: Iterable[_Page],
+    queue: Queue[_Page | Exception | None],
+    stop: Event,
+) -> None:
+    """Put fetched pages into the queue.
+
+    Args:
+        pages(Iterable): Pages of instance type information
+        queue(Queue): Destination queue. None is put at the end, or the
+            raised exception if fetching failed
+        stop(Event): Set by the consumer to stop fetching
+    """
+    try:
+        for page in pages:
+            if not _put_unless_stopped(queue, page, stop):
+                return
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        _put_unless_stopped(queue, e, stop)
+        return
+    _put_unless_stopped(queue, None, stop)
+
+
+def _describe_instance_types(
+    ec2: EC2Client, **kwargs: Any
+) -> list[InstanceType]:
+    """Describe instance types.
+
+    Pages are fetched by a background thread so that the next page is
+    requested while the current one is being parsed.
+
+    Args:
+        ec2(EC2Client): EC2 client
+        **kwargs: Parameters passed to DescribeInstanceTypes
+
+    Returns:
+        list: Instance types
+
+    Raises:
+        Exception: Exception raised while fetching pages
+    """
+    pages = (
+        page["InstanceTypes"]
+        for page in ec2.get_paginator("describe_instance_types").paginate(
+            **kwargs
+        )
+    )
+    queue: Queue[_Page | Exception | None] = Queue(_PREFETCH_PAGES)
+    stop = Event()
+    Thread(
+        target=_prefetch_pages, args=(pages, queue, stop), daemon=True
+    ).start()
+    ret: list[InstanceType] = []
+    try:
+        while (page := queue.get()) is not None:
+            if isinstance(page, Exception):
+                raise page
+            ret.extend([InstanceType(t) for t in page])
+    finally:
+        # Let the producer exit if parsing failed before the last page.
+        stop.set()
+    return ret
+
+
+def _instance_type_filters(
+    current_only: bool, architectures: tuple[str, ...]
+) -> list[FilterTypeDef]:
+    """Build DescribeInstanceTypes filters.
+
+    Args:
+        current_only(bool): Only current generation instance types
+        architectures(tuple): Supported architectures to match. Empty
+            matches any architecture
+
+    Returns:
+        list: Filters
+    """
+    filters: list[FilterTypeDef] = []
+    if current_only:
+        filters.append({"Name": "current-generation", "Values": ["true"]})
+    if architectures:
+        filters.append(
+            {
+                "Name": "processor-info.supported-architecture",
+                "Values": list(architectures),
+            }
+        )
+    return filters
+
+
+class _Catalog:
+    """Instance types catalog of a partition."""
+
+    __slots__ = ("fetched_at", "instance_types", "fetching")
+
+    def __init__(
+        self: _Catalog, instance_types: dict[str, InstanceType | None]
+    ) -> None:
+        """Initialize data.
+
+        Args:
+            instance_types(dict): Instance types keyed by instance type
+                name. None for names known not to match the filters
+        """
+        self.fetched_at = monotonic()
+        self.instance_types = instance_types
+        self.fetching: dict[str, Event] = {}
+
+
+_catalog_lock = Lock()
+_catalogs: dict[tuple[str, bool, tuple[str, ...]], _Catalog] = {}
+
+
+def catalog_region(partition: str, region_name: str) -> str:
+    """Get the region to fetch the instance types catalog from.
+
+    Args:
+        partition(str): Partition name, such as aws
+        region_name(str): Region used if the partition is not known
+
+    Returns:
+        str: Region name
+    """
+    return _CATALOG_REGIONS.get(partition, region_name)
+
+
+def _offered_instance_types(ec2: EC2Client) -> list[str]:
+    """Get names of instance types offered in the client's region.
+
+    Args:
+        ec2(EC2Client): EC2 client
+
+    Returns:
+        list: Instance type names
+    """
+    return [
+        o["InstanceType"]
+        for page in ec2.get_paginator(
+            "describe_instance_type_offerings"
+        ).paginate(
+            LocationType="region",
+            PaginationConfig={"PageSize": _OFFERINGS_PAGE_SIZE},
+        )
+        for o in page["InstanceTypeOfferings"]
+    ]
+
+
+def _get_catalog(
+    ec2: EC2Client, current_only: bool, architectures: tuple[str, ...]
+) -> _Catalog:
+    """Get instance types catalog of the client's partition.
+
+    Instance type specs are shared by the regions of a partition, so the
+    catalog is fetched once per filter and kept for _CATALOG_TTL seconds.
+    With filters, the types offered in the catalog region that do not
+    match are recorded as None, so that other regions do not describe
+    them again.
+
+    Args:
+        ec2(EC2Client): EC2 client used if the catalog is not cached
+        current_only(bool): Only current generation instance types
+        architectures(tuple): Supported architectures to match
+
+    Returns:
+        _Catalog: Instance types catalog
+    """
+    key = (ec2.meta.partition, current_only, architectures)
+    with _catalog_lock:
+        cached = _catalogs.get(key)
+        if cached and monotonic() - cached.fetched_at < _CATALOG_TTL:
+            return cached
+        filters = _instance_type_filters(current_only, architectures)
+        instance_types: dict[str, InstanceType | None] = {}
+        if filters:
+            instance_types = dict.fromkeys(_offered_instance_types(ec2))
+        instance_types.update(
+            (t.name, t)
+            for t in _describe_instance_types(
+                ec2,
+                Filters=filters,
+                PaginationConfig={"PageSize": _DESCRIBE_PAGE_SIZE},
             )
-        ]
-        self.support_hibernation = data.get("HibernationSupported", False)
-        self.burstable = data.get("BurstablePerformanceSupported", False)
+        )
+        catalog = _Catalog(instance_types)
+        _catalogs[key] = catalog
+        return catalog
+
+
+def _fill_catalog(
+    ec2: EC2Client,
+    catalog: _Catalog,
+    names: list[str],
+    current_only: bool,
+    architectures: tuple[str, ...],
+) -> None:
+    """Describe the names not in the catalog yet and add them.
+
+    Names being described by another region are waited for instead of
+    being described again.
+
+    Args:
+        ec2(EC2Client): EC2 client of the region offering the names
+        catalog(_Catalog): Catalog to fill
+        names(list): Instance type names
+        current_only(bool): Only current generation instance types
+        architectures(tuple): Supported architectures to match
+    """
+    while True:
+        with _catalog_lock:
+            unknown = [n for n in names if n not in catalog.instance_types]
+            waiting = {
+                catalog.fetching[n] for n in unknown if n in catalog.fetching
+            }
+            missing = [n for n in unknown if n not in catalog.fetching]
+            done = Event()
+            for name in missing:
+                catalog.fetching[name] = done
+        try:
+            for i in range(0, len(missing), _DESCRIBE_BATCH_SIZE):
+                batch = missing[i : i + _DESCRIBE_BATCH_SIZE]
+                found = {
+                    t.name: t
+                    for t in _describe_instance_types(
+                        ec2,
+                        InstanceTypes=batch,
+                        Filters=_instance_type_filters(
+                            current_only, architectures
+                        ),
+                    )
+                }
+                with _catalog_lock:
+                    for name in batch:
+                        catalog.instance_types[name] = found.get(name)
+        finally:
+            with _catalog_lock:
+                for name in missing:
+                    del catalog.fetching[name]
+            done.set()
+        if not waiting:
+            return
+        # Names whose fetch failed in the other region are retried here.
+        for event in waiting:
+            event.wait()
 
 
 def get_instance_types(
-    session: Session, region_name: str
+    ec2: EC2Client,
+    catalog_ec2: EC2Client,
+    current_only: bool = False,
+    architectures: tuple[str, ...] = (),
 ) -> list[InstanceType]:
-    """."""
-    ec2 = session.client("ec2", region_name=region_name)
-    res = ec2.describe_instance_types()
-    ret = [InstanceType(t) for t in res["InstanceTypes"]]
-    while "NextToken" in res:
-        res = ec2.describe_instance_types(NextToken=res["NextToken"])
-        ret.extend([InstanceType(t) for t in res["InstanceTypes"]])
-    return ret
+    """Get instance types offered in the region.
+
+    Filters are applied by DescribeInstanceTypes, so instance types that
+    do not match are neither transferred nor parsed.
+
+    Args:
+        ec2(EC2Client): EC2 client of the region
+        catalog_ec2(EC2Client): EC2 client of the catalog_region() of the
+            partition
+        current_only(bool): Only current generation instance types
+        architectures(tuple): Supported architectures to match. Empty
+            matches any architecture
+
+    Returns:
+        list: Instance types
+    """
+    catalog = _get_catalog(catalog_ec2, current_only, architectures)
+    offered = _offered_instance_types(ec2)
+    _fill_catalog(ec2, catalog, offered, current_only, architectures)
+    instance_types = catalog.instance_types
+    return [t for name in offered if (t := instance_types[name]) is not None]
@@ -1,12 +1,26 @@
 """Region information."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
 from boto3.session import Session
 
+from .client import CLIENT_CONFIG
+
+if TYPE_CHECKING:
+    from mypy_boto3_ssm.client import SSMClient
+
+_MAX_WORKERS = 8
+_PARAM_PREFIX = "/aws/service/global-infrastructure/regions/"
+_GET_PARAMETERS_BATCH_SIZE = 10
+
 
 class RegionInfo:
     """Region information."""
 
+    __slots__ = ("name", "location", "display_name")
+
     def __init__(
         self: RegionInfo, name: str, location: str, display_name: str
     ) -> None:
@@ -22,10 +36,24 @@ class RegionInfo:
         self.display_name = display_name
 
 
+def _get_parameters(ssm: SSMClient, names: list[str]) -> dict[str, str]:
+    """Get SSM parameter values.
+
+    Args:
+        ssm(SSMClient): SSM client
+        names(list): Parameter names. Up to 10 names
+
+    Returns:
+        dict: Parameter values keyed by parameter name
+    """
+    params = ssm.get_parameters(Names=names)
+    return {param["Name"]: param["Value"] for param in params["Parameters"]}
+
+
 def get_regions(session: Session) -> list[RegionInfo]:
     """."""
-    ec2 = session.client("ec2")
-    ssm = session.client("ssm")
+    ec2 = session.client("ec2", config=CLIENT_CONFIG)
+    ssm = session.client("ssm", config=CLIENT_CONFIG)
     regions_res = ec2.describe_regions(
         Filters=[
             {
@@ -35,19 +63,28 @@ def get_regions(session: Session) -> list[RegionInfo]:
         ]
     )
     region_names = [r["RegionName"] for r in regions_res["Regions"]]
+    names = [
+        _PARAM_PREFIX + region_name + "/" + key
+        for region_name in region_names
+        for key in ("geolocationRegion", "longName")
+    ]
+    batches = [
+        names[i : i + _GET_PARAMETERS_BATCH_SIZE]
+        for i in range(0, len(names), _GET_PARAMETERS_BATCH_SIZE)
+    ]
+    values: dict[str, str] = {}
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(_MAX_WORKERS, len(batches)))
+    ) as executor:
+        for batch_values in executor.map(
+            lambda batch: _get_parameters(ssm, batch), batches
+        ):
+            values.update(batch_values)
     ret: list[RegionInfo] = []
     for region_name in region_names:
-        param_path = (
-            "/aws/service/global-infrastructure/regions/" + region_name
-        )
-        params = ssm.get_parameters_by_path(Path=param_path)
-        location: str | None = None
-        display_name: str | None = None
-        for param in params["Parameters"]:
-            if param["Name"] == param_path + "/geolocationRegion":
-                location = param["Value"]
-            if param["Name"] == param_path + "/longName":
-                display_name = param["Value"]
+        param_path = _PARAM_PREFIX + region_name
+        location = values.get(param_path + "/geolocationRegion")
+        display_name = values.get(param_path + "/longName")
         if not location or not display_name:
             continue
         ret.append(RegionInfo(region_name, location, display_name))